@@ -0,0 +1,69 @@
+"""
+The enemy_kernels module contains the per-frame update routines for enemies
+that are moved in batch.  Each routine works in place on the game's enemy
+arrays and only touches the slots listed in the given index list.
+"""
+from array import array
+from math import copysign, sqrt
+
+# the kernels take the game's arrays as plain arguments so that the inner
+# loops only touch locals
+# pylint: disable=too-many-arguments,too-many-positional-arguments
+
+
+def update_random_walk(xs: array, ys: array, vx: array, vy: array,
+                       halves: array, max_xs: array, max_ys: array,
+                       slots: list[int], width: float, height: float) -> None:
+    """
+    Move random-walk enemies by their velocities and bounce them off the
+    screen borders; enemy i stays within halves[i] and max_xs[i]/max_ys[i]
+    """
+    # pylint: disable=too-many-locals
+    mid_x, mid_y = width / 2, height / 2
+    for i in slots:
+        # range of positions that keep the enemy inside the screen
+        lo = halves[i]
+        max_x, max_y = max_xs[i], max_ys[i]
+        x = xs[i] + vx[i]
+        y = ys[i] + vy[i]
+        # when hitting a boundary, point the velocity back to the middle of
+        # the screen and clamp the enemy inside, so it cannot get stuck
+        # flipping direction outside the wall
+        if x <= lo or x >= max_x:
+            vx[i] = copysign(vx[i], mid_x - x)
+            x = min(max(x, lo), max_x)
+        if y <= lo or y >= max_y:
+            vy[i] = copysign(vy[i], mid_y - y)
+            y = min(max(y, lo), max_y)
+        xs[i] = x
+        ys[i] = y
+
+
+def update_chase(xs: array, ys: array, speeds: array, slots: list[int],
+                 px: float, py: float) -> None:
+    """
+    Move chasing enemies towards the point (px, py)
+    """
+    for i in slots:
+        dx = px - xs[i]
+        dy = py - ys[i]
+        d2 = dx*dx + dy*dy  # squared distance to player
+        if d2 > 0.0:
+            # Slow down if too close to the player (closer than 50)
+            speed_modifier = 0.5 if d2 < 2500.0 else 1.0
+            inv = (speeds[i] * speed_modifier) / sqrt(d2)
+            xs[i] += dx * inv
+            ys[i] += dy * inv
+
+
+def hits_point(xs: array, ys: array, halves: array, count: int,
+               px: float, py: float) -> bool:
+    """
+    Check whether the point (px, py) lies inside any of the first count
+    enemies
+    """
+    for i in range(count):
+        half = halves[i]
+        if -half < px - xs[i] < half and -half < py - ys[i] < half:
+            return True
+    return False
@@ -12,6 +12,8 @@ class GameElement(ABC):
     be displayed on the game's screen
     """
 
+    __slots__ = ("__game", "__x", "__y")
+
     def __init__(self, game: "Game"):
         self.__game: "Game" = game
         self.__x: float = 0
@@ -133,6 +135,13 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         """
         return self.__canvas
 
+    @property
+    def update_delay(self) -> int:
+        """
+        Get the delay between two frames, in milliseconds
+        """
+        return self.__update_delay
+
     @property
     def is_started(self) -> bool:
         """
@@ -154,12 +163,30 @@ class Game(tk.Frame, ABC): # pylint: disable=too-many-ancestors
         """
         self.__started = False
 
+    def tick(self) -> None:
+        """
+        Perform game-wide work once per frame, after all elements have been
+        updated and before they are rendered
+        """
+
+    def flush(self) -> None:
+        """
+        Flush pending drawing to the screen; get called once per frame after
+        all elements have been rendered
+        """
+        self.canvas.update_idletasks()
+
     def animate(self):
         """
         Update and render all game's elements
         """
+        # update all elements first, then render them, then flush the canvas
+        # once so the screen is redrawn only once per frame
         for element in self.__game_elements:
             element.update()
+        self.tick()
+        for element in self.__game_elements:
             element.render()
+        self.flush()
         if self.__started:
             self.after(self.__update_delay, self.animate)
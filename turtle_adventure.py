@@ -2,11 +2,30 @@
 The turtle_adventure module maintains all classes related to the Turtle's
 adventure game.
 """
-from turtle import RawTurtle
+from array import array
+from collections import defaultdict
+from typing import Final, cast
 import random
 import math
 
 from gamelib import Game, GameElement
+from enemy_kernels import update_random_walk, update_chase, hits_point
+
+# outline of the "turtle" shape of Python's turtle module, head pointing
+# along the y axis
+TURTLE_SHAPE: Final = (
+    (0, 16), (-2, 14), (-1, 10), (-4, 7), (-7, 9), (-9, 8), (-6, 5), (-7, 1),
+    (-5, -3), (-8, -6), (-6, -8), (-4, -5), (0, -7), (4, -5), (6, -8), (8, -6),
+    (5, -3), (7, 1), (6, 5), (9, 8), (7, 9), (4, 7), (1, 10), (2, 14),
+)
+
+# cosine and sine of every tenth of a degree, indexed by angle * 10
+COS_TABLE: Final = [math.cos(math.radians(a / 10)) for a in range(3600)]
+SIN_TABLE: Final = [math.sin(math.radians(a / 10)) for a in range(3600)]
+
+# number of enemy slots allocated up front; the enemy arrays double when
+# they run out
+ENEMY_CAPACITY: Final = 256
 
 
 class TurtleGameElement(GameElement):
@@ -15,16 +34,17 @@ class TurtleGameElement(GameElement):
     Adventure game
     """
 
+    __slots__ = ()
+
     def __init__(self, game: "TurtleAdventureGame"):
         super().__init__(game)
-        self.__game: "TurtleAdventureGame" = game
 
     @property
     def game(self) -> "TurtleAdventureGame":
         """
         Get reference to the associated TurtleAnvengerGame instance
         """
-        return self.__game
+        return cast("TurtleAdventureGame", super().game)
 
 
 class Waypoint(TurtleGameElement):
@@ -32,11 +52,15 @@ class Waypoint(TurtleGameElement):
     Represent the waypoint to which the player will move.
     """
 
+    __slots__ = ("__active", "__id1", "__id2", "__last_state", "__last_xy")
+
     def __init__(self, game: "TurtleAdventureGame"):
         super().__init__(game)
         self.__id1: int
         self.__id2: int
         self.__active: bool = False
+        self.__last_state: str | None = None
+        self.__last_xy: tuple[float, float] | None = None
 
     def create(self) -> None:
         self.__id1 = self.canvas.create_line(0, 0, 0, 0, width=2, fill="green")
@@ -51,16 +75,16 @@ class Waypoint(TurtleGameElement):
         pass
 
     def render(self) -> None:
-        if self.is_active:
-            self.canvas.itemconfigure(self.__id1, state="normal")
-            self.canvas.itemconfigure(self.__id2, state="normal")
-            self.canvas.tag_raise(self.__id1)
-            self.canvas.tag_raise(self.__id2)
+        # only talk to the canvas when the state or the position has changed
+        state = "normal" if self.is_active else "hidden"
+        if state != self.__last_state:
+            self.canvas.itemconfigure(self.__id1, state=state)
+            self.canvas.itemconfigure(self.__id2, state=state)
+            self.__last_state = state
+        if self.is_active and (self.x, self.y) != self.__last_xy:
             self.canvas.coords(self.__id1, self.x-10, self.y-10, self.x+10, self.y+10)
             self.canvas.coords(self.__id2, self.x-10, self.y+10, self.x+10, self.y-10)
-        else:
-            self.canvas.itemconfigure(self.__id1, state="hidden")
-            self.canvas.itemconfigure(self.__id2, state="hidden")
+            self.__last_xy = (self.x, self.y)
 
     def activate(self, x: float, y: float) -> None:
         """
@@ -69,6 +93,9 @@ class Waypoint(TurtleGameElement):
         self.__active = True
         self.x = x
         self.y = y
+        # bring the marker above the enemies created since it was last shown
+        self.canvas.tag_raise(self.__id1)
+        self.canvas.tag_raise(self.__id2)
 
     def deactivate(self) -> None:
         """
@@ -89,10 +116,13 @@ class Home(TurtleGameElement):
     Represent the player's home.
     """
 
+    __slots__ = ("__id", "__last_rendered", "__size")
+
     def __init__(self, game: "TurtleAdventureGame", pos: tuple[int, int], size: int):
         super().__init__(game)
         self.__id: int
         self.__size: int = size
+        self.__last_rendered: tuple[float, float, int] | None = None
         x, y = pos
         self.x = x
         self.y = y
@@ -119,6 +149,10 @@ class Home(TurtleGameElement):
         pass
 
     def render(self) -> None:
+        # home is static, so its item only needs redrawing when it changes
+        if (self.x, self.y, self.size) == self.__last_rendered:
+            return
+        self.__last_rendered = (self.x, self.y, self.size)
         self.canvas.coords(self.__id,
                            self.x - self.size/2,
                            self.y - self.size/2,
@@ -136,25 +170,26 @@ class Home(TurtleGameElement):
 
 class Player(TurtleGameElement):
     """
-    Represent the main player, implemented using Python's turtle.
+    Represent the main player, drawn as a turtle-shaped polygon on the canvas.
     """
 
+    __slots__ = ("__cos", "__id", "__last_rendered", "__sin", "__speed")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
-                 turtle: RawTurtle,
                  speed: float = 5):
         super().__init__(game)
         self.__speed: float = speed
-        self.__turtle: RawTurtle = turtle
+        self.__id: int
+        # unit vector of the player's heading
+        self.__cos: float = 1.0
+        self.__sin: float = 0.0
+        self.__last_rendered: tuple[float, float, float, float] | None = None
 
     def create(self) -> None:
-        turtle = RawTurtle(self.canvas)
-        turtle.getscreen().tracer(False)  # disable turtle's built-in animation
-        turtle.shape("turtle")
-        turtle.color("green")
-        turtle.penup()
-
-        self.__turtle = turtle
+        self.__id = self.canvas.create_polygon(self.__shape_coords(),
+                                               fill="green",
+                                               outline="green")
 
     @property
     def speed(self) -> float:
@@ -168,43 +203,44 @@ class Player(TurtleGameElement):
         self.__speed = val
 
     def delete(self) -> None:
-        pass
+        self.canvas.delete(self.__id)
 
     def update(self) -> None:
         # check if player has arrived home
         if self.game.home.contains(self.x, self.y):
             self.game.game_over_win()
-        turtle = self.__turtle
         waypoint = self.game.waypoint
-        if self.game.waypoint.is_active:
-            turtle.setheading(turtle.towards(waypoint.x, waypoint.y))
-            turtle.forward(self.speed)
-            if turtle.distance(waypoint.x, waypoint.y) < self.speed:
+        if waypoint.is_active:
+            x, y = self.x, self.y
+            wx, wy = waypoint.x, waypoint.y
+            speed = self.speed
+            heading = math.atan2(wy - y, wx - x)
+            self.__cos = math.cos(heading)
+            self.__sin = math.sin(heading)
+            x += speed * self.__cos
+            y += speed * self.__sin
+            self.x, self.y = x, y
+            # compare squared distances to skip the square root
+            dx, dy = wx - x, wy - y
+            if dx*dx + dy*dy < speed*speed:
                 waypoint.deactivate()
 
     def render(self) -> None:
-        self.__turtle.goto(self.x, self.y)
-        self.__turtle.getscreen().update()
-
-    # override original property x's getter/setter to use turtle's methods
-    # instead
-    @property
-    def x(self) -> float:
-        return self.__turtle.xcor()
-
-    @x.setter
-    def x(self, val: float) -> None:
-        self.__turtle.setx(val)
-
-    # override original property y's getter/setter to use turtle's methods
-    # instead
-    @property
-    def y(self) -> float:
-        return self.__turtle.ycor()
-
-    @y.setter
-    def y(self, val: float) -> None:
-        self.__turtle.sety(val)
+        state = (self.x, self.y, self.__cos, self.__sin)
+        if state == self.__last_rendered:
+            return
+        self.__last_rendered = state
+        self.canvas.coords(self.__id, self.__shape_coords())
+
+    def __shape_coords(self) -> list[float]:
+        # rotate the turtle shape, whose head points along its y axis, to
+        # the current heading and place it at the player's position
+        x, y, c, s = self.x, self.y, self.__cos, self.__sin
+        coords = []
+        for sx, sy in TURTLE_SHAPE:
+            coords.append(x + sy*c - sx*s)
+            coords.append(y + sy*s + sx*c)
+        return coords
 
 
 class Enemy(TurtleGameElement):
@@ -212,6 +248,10 @@ class Enemy(TurtleGameElement):
     Define an abstract enemy for the Turtle's adventure game
     """
 
+    # pylint: disable=too-many-instance-attributes
+    __slots__ = ("__color", "__half", "__last_xy", "__size", "__slot",
+                 "__speed", "__xs", "__ys")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
@@ -221,6 +261,59 @@ class Enemy(TurtleGameElement):
         self.__size = size
         self.__color = color
         self.__speed = speed
+        self.__half = size / 2
+        self.__last_xy: tuple[float, float] | None = None
+        # the position is kept in arrays of its own until the enemy is
+        # attached to the game's position arrays by add_enemy()
+        self.__xs = array("d", [0.0])
+        self.__ys = array("d", [0.0])
+        self.__slot = 0
+
+    # override original property x's getter/setter to use the position
+    # arrays instead
+    @property
+    def x(self) -> float:
+        return self.__xs[self.__slot]
+
+    @x.setter
+    def x(self, val: float) -> None:
+        self.__xs[self.__slot] = val
+
+    # override original property y's getter/setter to use the position
+    # arrays instead
+    @property
+    def y(self) -> float:
+        return self.__ys[self.__slot]
+
+    @y.setter
+    def y(self, val: float) -> None:
+        self.__ys[self.__slot] = val
+
+    @property
+    def slot(self) -> int:
+        """
+        Get the index of the enemy in the game's enemy arrays
+        """
+        return self.__slot
+
+    def attach(self, xs: array, ys: array, slot: int) -> None:
+        """
+        Move the enemy's position into the given slot of the position arrays
+        """
+        xs[slot] = self.x
+        ys[slot] = self.y
+        self.__xs = xs
+        self.__ys = ys
+        self.__slot = slot
+
+    def detach(self) -> None:
+        """
+        Move the enemy's position out of the game's position arrays into
+        arrays of its own
+        """
+        self.__xs = array("d", [self.x])
+        self.__ys = array("d", [self.y])
+        self.__slot = 0
 
     @property
     def size(self) -> float:
@@ -229,6 +322,13 @@ class Enemy(TurtleGameElement):
         """
         return self.__size
 
+    @property
+    def half_size(self) -> float:
+        """
+        Get half the size of the enemy
+        """
+        return self.__half
+
     @property
     def speed(self) -> float:
         """
@@ -236,6 +336,13 @@ class Enemy(TurtleGameElement):
         """
         return self.__speed
 
+    @property
+    def initial_velocity(self) -> tuple[float, float]:
+        """
+        Get the velocity the enemy starts with when moved in batch
+        """
+        return 0.0, 0.0
+
     @property
     def color(self) -> str:
         """
@@ -243,15 +350,34 @@ class Enemy(TurtleGameElement):
         """
         return self.__color
 
+    def place_item(self, item: int) -> None:
+        """
+        Place the canvas item so that it is centered at the enemy's position
+        """
+        x, y = self.x, self.y
+        last = self.__last_xy
+        if last is None:
+            # first placement: set the item's coordinates directly
+            half = self.__half
+            self.canvas.coords(item, x - half, y - half, x + half, y + half)
+        else:
+            # skip the canvas call until the enemy has moved by at least half
+            # a pixel since it was last drawn, as smaller moves are not
+            # visible; otherwise shift the item by the offset
+            dx, dy = x - last[0], y - last[1]
+            if abs(dx) < 0.5 and abs(dy) < 0.5:
+                return
+            self.canvas.move(item, dx, dy)
+        self.__last_xy = (x, y)
+
     def hits_player(self):
         """
         Check whether the enemy is hitting the player
         """
-        return (
-            (self.x - self.size/2 < self.game.player.x < self.x + self.size/2)
-            and
-            (self.y - self.size/2 < self.game.player.y < self.y + self.size/2)
-        )
+        player = self.game.player
+        px, py = player.x, player.y
+        x, y, half = self.x, self.y, self.__half
+        return (x - half < px < x + half) and (y - half < py < y + half)
 
 
 # TODO
@@ -265,6 +391,8 @@ class DemoEnemy(Enemy):
     Demo enemy
     """
 
+    __slots__ = ("__id",)
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
@@ -274,23 +402,17 @@ class DemoEnemy(Enemy):
         self.__id = None
 
     def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill="red")
+        self.__id = self.game.new_enemy_item("oval", "red")
 
     def update(self) -> None:
         self.x += 1
         self.y += 1
-        if self.hits_player():
-            self.game.game_over_lose()
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size/2,
-                           self.y - self.size/2,
-                           self.x + self.size/2,
-                           self.y + self.size/2)
+        self.place_item(self.__id)
 
     def delete(self) -> None:
-        self.canvas.delete(self.__id)
+        self.game.release_enemy_item("oval", self.__id)
 
 
 class RandomWalkEnemy(Enemy):
@@ -298,6 +420,8 @@ class RandomWalkEnemy(Enemy):
     RandomWalkEnemy : will walk randomly on the screen.
     """
 
+    __slots__ = ("__id", "__x_speed", "__y_speed")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
@@ -308,34 +432,23 @@ class RandomWalkEnemy(Enemy):
         self.__x_speed = random.uniform(-1, 1)
         self.__y_speed = random.uniform(-1, 1)
 
+    @property
+    def initial_velocity(self) -> tuple[float, float]:
+        return self.__x_speed, self.__y_speed
+
     def create(self) -> None:
-        self.__id = self.canvas.create_rectangle(0, 0, 0, 0, fill=self.color)
+        self.__id = self.game.new_enemy_item("rectangle", self.color)
 
     def update(self) -> None:
-        self.x += self.__x_speed
-        self.y += self.__y_speed
-
-        if self.x - self.size / 2 <= 0 or self.x + self.size / 2 >= self.game.screen_width:
-            self.__x_speed *= -1  # Reverse x direction if hitting left or right boundary
-        if self.y - self.size / 2 <= 0 or self.y + self.size / 2 >= self.game.screen_height:
-            self.__y_speed *= -1  # Reverse y direction if hitting top or bottom boundary
-
-        self.canvas.move(self.__id, self.__x_speed, self.__y_speed)
-
-        if self.hits_player():
-            self.game.game_over_lose()
+        # movement of all random-walk enemies is done in one batch by
+        # TurtleAdventureGame.tick()
+        pass
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-        self.canvas.update()
+        self.place_item(self.__id)
 
     def delete(self) -> None:
-        self.canvas.delete(self.__id)
+        self.game.release_enemy_item("rectangle", self.__id)
 
 
 class ChasingEnemy(Enemy):
@@ -343,6 +456,9 @@ class ChasingEnemy(Enemy):
     ChasingEnemy : will try chasing the player. Try not to move this enemy too fast, otherwise the player
     will have no chance to win.
     """
+
+    __slots__ = ("__id",)
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
@@ -352,43 +468,18 @@ class ChasingEnemy(Enemy):
         self.__id = None
 
     def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
+        self.__id = self.game.new_enemy_item("oval", self.color)
 
     def update(self) -> None:
-        player = self.game.player
-        dx = player.x - self.x
-        dy = player.y - self.y
-        distance_to_player = (dx ** 2 + dy ** 2) ** 0.5  # Calculate distance to player
-
-        # Adjust speed based on the distance to the player
-        if distance_to_player > 0:
-            if distance_to_player < 50:
-                speed_modifier = 0.5  # Slow down if too close to the player
-            else:
-                speed_modifier = 1.0
-
-            # Calculate movement direction towards the player
-            dx /= distance_to_player
-            dy /= distance_to_player
-
-            # Move enemy towards the player
-            self.x += dx * self.speed * speed_modifier
-            self.y += dy * self.speed * speed_modifier
-
-        if self.hits_player():
-            self.game.game_over_lose()
+        # movement of all chasing enemies is done in one batch by
+        # TurtleAdventureGame.tick()
+        pass
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
-
-        self.canvas.update()
+        self.place_item(self.__id)
 
     def delete(self) -> None:
-        self.canvas.delete(self.__id)
+        self.game.release_enemy_item("oval", self.__id)
 
 
 class FencingEnemy(Enemy):
@@ -396,48 +487,73 @@ class FencingEnemy(Enemy):
     FencingEnemy : will walk around the home in a square-like pattern.
     """
 
+    __slots__ = ("__dirs", "__home_x", "__home_y", "__id", "__index",
+                 "__radius", "__targets")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
                  color: str,
                  speed: float,
-                 angular_speed: float = 3.0):  # Adjust the default angular speed
+                 radius: float = 30):
         super().__init__(game, size, color, speed)
         self.__id = None
         self.__home_x, self.__home_y = self.game.home.x, self.game.home.y
-        self.__speed = speed
-        self.angle = 0
-        self.__angular_speed = angular_speed  # Store the angular speed
+        self.__radius = radius
+        self.__targets: list[tuple[float, float]] = []
+        self.__dirs: list[tuple[float, float]] = []
+        self.__index = 0
+        self.calculate_square_path()
+        # start at the last corner, heading towards the first one
+        self.x, self.y = self.__targets[-1]
+
+    def calculate_square_path(self) -> None:
+        """
+        Compute the corners of the square around home, and the unit direction
+        of the side leading to each corner
+        """
+        hx, hy, r = self.__home_x, self.__home_y, self.__radius
+        self.__targets = [(hx - r, hy - r), (hx + r, hy - r),
+                          (hx + r, hy + r), (hx - r, hy + r)]
+        self.__dirs = []
+        for i, (bx, by) in enumerate(self.__targets):
+            ax, ay = self.__targets[i - 1]
+            length = math.hypot(bx - ax, by - ay)
+            self.__dirs.append(((bx - ax) / length, (by - ay) / length))
+        self.__index = 0
 
     def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
+        self.__id = self.game.new_enemy_item("oval", self.color)
 
     def update(self) -> None:
-        radius = 30
-        self.angle += self.__angular_speed  # Use the adjusted angular speed
-        new_x = self.__home_x + radius * math.cos(math.radians(self.angle))
-        new_y = self.__home_y + radius * math.sin(math.radians(self.angle))
-
-        self.x, self.y = new_x, new_y
-
-        if self.hits_player():
-            self.game.game_over_lose()
+        step = self.speed
+        tx, ty = self.__targets[self.__index]
+        dx = tx - self.x
+        dy = ty - self.y
+        if dx*dx + dy*dy <= step*step:
+            # arrived at the corner; turn towards the next one
+            self.x, self.y = tx, ty
+            self.__index = (self.__index + 1) % len(self.__targets)
+        else:
+            ux, uy = self.__dirs[self.__index]
+            self.x += ux * step
+            self.y += uy * step
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2, )
+        self.place_item(self.__id)
 
     def delete(self) -> None:
-        pass
+        self.game.release_enemy_item("oval", self.__id)
 
 
 class CircularEnemy(Enemy):
     """
     CircularEnemy : represents enemies that move in a circular path around a center point.
     """
+
+    __slots__ = ("__angle", "__angle_step", "__center", "__id", "__index",
+                 "__positions", "__radius")
+
     def __init__(self,
                  game: "TurtleAdventureGame",
                  size: int,
@@ -450,31 +566,43 @@ class CircularEnemy(Enemy):
         self.__id = None
         self.__center = center
         self.__radius = radius
+        # angle and angular speed in tenths of a degree, to index the
+        # trigonometric tables
         self.__angle = 0
-        self.__angular_speed = angular_speed
+        self.__angle_step = round(angular_speed * 10)
+        # start on the circle at angle 0
+        self.x = center[0] + radius
+        self.y = center[1]
+        # when the path repeats after a whole number of steps, precompute
+        # every position on it so update() needs no trigonometry
+        self.__positions: list[tuple[float, float]] = []
+        self.__index = 0
+        step = int(angular_speed)
+        if step == angular_speed and step > 0 and 360 % step == 0:
+            cx, cy = center
+            self.__positions = [
+                (cx + radius * math.cos(math.radians(a)),
+                 cy + radius * math.sin(math.radians(a)))
+                for a in range(0, 360, step)
+            ]
 
     def create(self) -> None:
-        self.__id = self.canvas.create_oval(0, 0, 0, 0, fill=self.color)
+        self.__id = self.game.new_enemy_item("oval", self.color)
 
     def update(self) -> None:
-        self.__angle += self.__angular_speed
-        self.__angle %= 360
-        radian_angle = math.radians(self.__angle)
-        self.x = self.__center[0] + self.__radius * math.cos(radian_angle)
-        self.y = self.__center[1] + self.__radius * math.sin(radian_angle)
-
-        if self.hits_player():
-            self.game.game_over_lose()
+        if self.__positions:
+            self.__index = (self.__index + 1) % len(self.__positions)
+            self.x, self.y = self.__positions[self.__index]
+        else:
+            self.__angle = (self.__angle + self.__angle_step) % 3600
+            self.x = self.__center[0] + self.__radius * COS_TABLE[self.__angle]
+            self.y = self.__center[1] + self.__radius * SIN_TABLE[self.__angle]
 
     def render(self) -> None:
-        self.canvas.coords(self.__id,
-                           self.x - self.size / 2,
-                           self.y - self.size / 2,
-                           self.x + self.size / 2,
-                           self.y + self.size / 2)
+        self.place_item(self.__id)
 
     def delete(self) -> None:
-        self.canvas.delete(self.__id)
+        self.game.release_enemy_item("oval", self.__id)
 
 
 # TODO
@@ -494,10 +622,9 @@ class EnemyGenerator:
     def __init__(self, game: "TurtleAdventureGame", level: int):
         self.__game: TurtleAdventureGame = game
         self.__level: int = level
-        # self.__interval = 1000
-
-        # example
-        self.__game.after(100, self.create_enemy)
+        # the first batch of enemies appears about 100 ms after the start;
+        # None once the game has all the enemies its level allows
+        self.__next_spawn_frame: int | None = self.__frames(100)
 
     @property
     def game(self) -> "TurtleAdventureGame":
@@ -513,10 +640,36 @@ class EnemyGenerator:
         """
         return self.__level
 
+    @property
+    def max_enemies(self) -> int:
+        """
+        Get the number of enemies after which no more batches are created
+        """
+        return 5 + 3 * self.__level
+
+    def __frames(self, delay: int) -> int:
+        # convert a delay in milliseconds into a number of frames
+        return max(1, round(delay / self.__game.update_delay))
+
+    def tick(self, frame: int) -> None:
+        """
+        Create the next batch of enemies if it is due at the given frame
+        """
+        if self.__next_spawn_frame is None or frame < self.__next_spawn_frame:
+            return
+        self.create_enemy()
+        if len(self.game.enemies) >= self.max_enemies:
+            self.__next_spawn_frame = None
+        else:
+            delay = random.randint(1000, 2000)
+            self.__next_spawn_frame = frame + self.__frames(delay)
+
     def create_enemy(self) -> None:
         """
         Create a new enemy, possibly based on the game level
         """
+        if len(self.game.enemies) >= self.max_enemies:
+            return
         num_fencing_enemies = 3
 
         new_random_enemy = RandomWalkEnemy(self.__game, size=20, color="blue", speed=7.0)
@@ -530,11 +683,7 @@ class EnemyGenerator:
         self.game.add_enemy(new_chasing_enemy)
 
         for _ in range(num_fencing_enemies):
-            new_enemy = FencingEnemy(self.__game, 16, "green", 20)
-            random_x = (self.game.home.x + 20, self.game.home.x + 40)
-            random_y = (self.game.home.y + 20, self.game.home.y + 40)
-            new_enemy.x = random_x
-            new_enemy.y = random_y
+            new_enemy = FencingEnemy(self.__game, 16, "green", 1.5)
             self.game.add_enemy(new_enemy)
 
         center = (self.__game.screen_width // 2, self.__game.screen_height // 2)
@@ -544,9 +693,6 @@ class EnemyGenerator:
                                            center=center, radius=radius, angular_speed=angular_speed)
         self.game.add_enemy(new_circular_enemy)
 
-        delay = random.randint(1000, 2000)
-        self.__game.after(delay, self.create_enemy)
-
 
 class TurtleAdventureGame(Game):  # pylint: disable=too-many-ancestors
     """
@@ -562,35 +708,147 @@ class TurtleAdventureGame(Game):  # pylint: disable=too-many-ancestors
         self.player: Player
         self.home: Home
         self.enemies: list[Enemy] = []
+        # enemies' states kept as struct-of-arrays, indexed by Enemy.slot;
+        # only the first enemy_count slots are in use
+        self.enemy_count: int = 0
+        self.enemy_xs = array("d", [0.0]) * ENEMY_CAPACITY
+        self.enemy_ys = array("d", [0.0]) * ENEMY_CAPACITY
+        self.enemy_vx = array("d", [0.0]) * ENEMY_CAPACITY
+        self.enemy_vy = array("d", [0.0]) * ENEMY_CAPACITY
+        self.enemy_speeds = array("d", [0.0]) * ENEMY_CAPACITY
+        self.enemy_halves = array("d", [0.0]) * ENEMY_CAPACITY
+        # largest x and y that keep each enemy inside the screen
+        self.enemy_max_xs = array("d", [0.0]) * ENEMY_CAPACITY
+        self.enemy_max_ys = array("d", [0.0]) * ENEMY_CAPACITY
+        # enemy slots grouped by enemy class, so that each kind can be
+        # updated in one batch
+        self.__slots_by_type: defaultdict[type, list[int]] = defaultdict(list)
+        # hidden canvas items left by deleted enemies, by item kind, ready
+        # to be reused by new enemies
+        self.__item_pool: dict[str, list[int]] = {"oval": [], "rectangle": []}
         self.enemy_generator: EnemyGenerator
+        self.frame: int = 0
         super().__init__(parent)
 
         self.enemy_generator = EnemyGenerator(self, level=self.level)
 
     def init_game(self):
         self.canvas.config(width=self.screen_width, height=self.screen_height)
-        turtle = RawTurtle(self.canvas)
-        # set turtle screen's origin to the top-left corner
-        turtle.screen.setworldcoordinates(0, self.screen_height-1, self.screen_width-1, 0)
 
         self.waypoint = Waypoint(self)
         self.add_element(self.waypoint)
         self.home = Home(self, (self.screen_width-100, self.screen_height//2), 20)
         self.add_element(self.home)
-        self.player = Player(self, turtle)
+        self.player = Player(self)
         self.add_element(self.player)
         self.canvas.bind("<Button-1>", lambda e: self.waypoint.activate(e.x, e.y))
 
         self.player.x = 50
         self.player.y = self.screen_height//2
 
+    def tick(self) -> None:
+        """
+        Move all random-walk and chasing enemies in one batch, check
+        whether any enemy hits the player, then let the enemy generator
+        spawn enemies that are due
+        """
+        self.frame += 1
+        px, py = self.player.x, self.player.y
+        update_random_walk(self.enemy_xs, self.enemy_ys,
+                           self.enemy_vx, self.enemy_vy,
+                           self.enemy_halves,
+                           self.enemy_max_xs, self.enemy_max_ys,
+                           self.__slots_by_type[RandomWalkEnemy],
+                           self.screen_width, self.screen_height)
+        update_chase(self.enemy_xs, self.enemy_ys, self.enemy_speeds,
+                     self.__slots_by_type[ChasingEnemy], px, py)
+        if hits_point(self.enemy_xs, self.enemy_ys, self.enemy_halves,
+                      self.enemy_count, px, py):
+            self.game_over_lose()
+        self.enemy_generator.tick(self.frame)
+
     def add_enemy(self, enemy: Enemy) -> None:
         """
         Add a new enemy into the current game
         """
+        slot = self.enemy_count
+        if slot == len(self.enemy_xs):
+            self.__grow_enemy_arrays()
+        self.enemy_vx[slot], self.enemy_vy[slot] = enemy.initial_velocity
+        self.enemy_speeds[slot] = enemy.speed
+        self.enemy_halves[slot] = enemy.half_size
+        self.enemy_max_xs[slot] = self.screen_width - enemy.half_size
+        self.enemy_max_ys[slot] = self.screen_height - enemy.half_size
+        self.enemy_count += 1
+        enemy.attach(self.enemy_xs, self.enemy_ys, slot)
+        self.__slots_by_type[type(enemy)].append(slot)
         self.enemies.append(enemy)
         self.add_element(enemy)
 
+    def remove_enemy(self, enemy: Enemy) -> None:
+        """
+        Remove an enemy from the current game.  The last used slot of the
+        enemy arrays is moved into the freed slot, so that the used slots
+        stay packed at the front.
+        """
+        slot = enemy.slot
+        # a deleted enemy is detached into slot 0, so check the enemy really
+        # owns its slot before changing anything
+        if slot >= self.enemy_count or self.enemies[slot] is not enemy:
+            raise ValueError("enemy is not in the game")
+        last = self.enemy_count - 1
+        self.__slots_by_type[type(enemy)].remove(slot)
+        if slot != last:
+            moved = self.enemies[last]
+            moved.attach(self.enemy_xs, self.enemy_ys, slot)
+            for arr in (self.enemy_vx, self.enemy_vy,
+                        self.enemy_speeds, self.enemy_halves,
+                        self.enemy_max_xs, self.enemy_max_ys):
+                arr[slot] = arr[last]
+            slots = self.__slots_by_type[type(moved)]
+            slots[slots.index(last)] = slot
+            self.enemies[slot] = moved
+        self.enemies.pop()
+        self.enemy_count = last
+        enemy.detach()
+        super().delete_element(enemy)
+
+    def delete_element(self, element: GameElement) -> None:
+        # enemies also have to give up their slot in the enemy arrays
+        if isinstance(element, Enemy):
+            self.remove_enemy(element)
+        else:
+            super().delete_element(element)
+
+    def new_enemy_item(self, kind: str, color: str) -> int:
+        """
+        Get a canvas item of the given kind ("oval" or "rectangle") for an
+        enemy, reusing the item of a deleted enemy when there is one
+        """
+        pool = self.__item_pool[kind]
+        if pool:
+            item = pool.pop()
+            self.canvas.itemconfigure(item, fill=color, state="normal")
+            return item
+        if kind == "oval":
+            return self.canvas.create_oval(0, 0, 0, 0, fill=color)
+        return self.canvas.create_rectangle(0, 0, 0, 0, fill=color)
+
+    def release_enemy_item(self, kind: str, item: int) -> None:
+        """
+        Hide the canvas item of a deleted enemy and keep it for reuse
+        """
+        self.canvas.itemconfigure(item, state="hidden")
+        self.__item_pool[kind].append(item)
+
+    def __grow_enemy_arrays(self) -> None:
+        # double the capacity in place, so that the arrays already handed to
+        # enemies stay valid
+        for arr in (self.enemy_xs, self.enemy_ys, self.enemy_vx,
+                    self.enemy_vy, self.enemy_speeds, self.enemy_halves,
+                    self.enemy_max_xs, self.enemy_max_ys):
+            arr.extend(array("d", [0.0]) * len(arr))
+
     def game_over_win(self) -> None:
         """
         Called when the player wins the game and stop the game